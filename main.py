@@ -4,32 +4,46 @@ import time
 import csv
 import os
 import re
+import hashlib
 import threading
 import logging
+import math
 from datetime import datetime
+from functools import lru_cache
 
+import numpy as np
 import serial
 
 try:
     import yaml
+    # libyaml-backed loader when PyYAML was built with it
+    YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 except ImportError:
     yaml = None
+    YAML_LOADER = None
 
+# Fastest available parser for incoming serial lines; all accept bytes.
 try:
-    from mcap.writer import Writer as McapWriter
-    MCAP_AVAILABLE = True
+    from orjson import loads as json_loads
 except ImportError:
-    McapWriter = None
-    MCAP_AVAILABLE = False
+    try:
+        from ujson import loads as json_loads
+    except ImportError:
+        json_loads = json.loads
+
+# Used to split lines that carry several JSON documents back to back.
+_json_decoder = json.JSONDecoder()
 
 from PyQt5.QtWidgets import (
-    QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QTableWidget,
-    QTableWidgetItem, QHeaderView, QScrollArea, QLineEdit, QPushButton,
+    QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QTableView,
+    QHeaderView, QScrollArea, QLineEdit, QPushButton,
     QListWidget, QSizePolicy, QGridLayout, QFrame
 )
 from PyQt5.QtWidgets import QAbstractScrollArea
 from PyQt5.QtGui import QColor
-from PyQt5.QtCore import Qt, QObject, QThread, pyqtSignal
+from PyQt5.QtCore import (
+    Qt, QObject, QThread, QTimer, QAbstractTableModel, QModelIndex, pyqtSignal
+)
 
 
 # ---------------------------------------------------------------------
@@ -48,6 +62,21 @@ logger = logging.getLogger("serial_json_monitor")
 # Data logger
 # ---------------------------------------------------------------------
 
+def _load_mcap_writer():
+    """
+    Import the MCAP writer on first use.
+
+    Only MCAP logging needs it, so CSV sessions skip the import at startup.
+    Returns None when the mcap package is not installed.
+    """
+    try:
+        from mcap.writer import Writer
+    except ImportError:
+        return None
+
+    return Writer
+
+
 class SerialDataLogger:
     """
     CSV mode:
@@ -113,9 +142,11 @@ class SerialDataLogger:
         self.mcap_schemas = {}
 
         if self.log_format == "mcap":
-            if MCAP_AVAILABLE:
+            mcap_writer_cls = _load_mcap_writer()
+
+            if mcap_writer_cls is not None:
                 try:
-                    self._open_mcap(start_stamp)
+                    self._open_mcap(start_stamp, mcap_writer_cls)
                     logger.info("MCAP serial log file: %s", self.path)
                     return
                 except Exception as e:
@@ -152,11 +183,11 @@ class SerialDataLogger:
 
         self.csv_file.flush()
 
-    def _open_mcap(self, start_stamp):
+    def _open_mcap(self, start_stamp, mcap_writer_cls):
         self.path = os.path.join(self.log_dir, f"{self.prefix}_{start_stamp}.mcap")
 
         self.mcap_file = open(self.path, "wb")
-        self.mcap_writer = McapWriter(self.mcap_file)
+        self.mcap_writer = mcap_writer_cls(self.mcap_file)
 
         self.mcap_writer.start(
             profile="jsonschema",
@@ -636,13 +667,87 @@ class SerialDataLogger:
 # Config
 # ---------------------------------------------------------------------
 
-def load_config(path="config.yaml"):
+def _config_cache_path(path):
+    return path + ".cache.json"
+
+
+def _write_config_cache(cache_path, source, data):
+    """
+    Store the parsed YAML next to the config as JSON, together with the
+    (mtime_ns, size) of the YAML file it was parsed from.
+
+    Written to a temp file first and renamed, so a crash mid-write never
+    leaves a truncated cache behind.
+    """
+    tmp_path = cache_path + ".tmp"
+
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"source": source, "data": data}, f, ensure_ascii=False)
+
+        os.replace(tmp_path, cache_path)
+
+    except Exception as e:
+        logger.debug("Could not write config cache %s: %s", cache_path, e)
+
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def _read_config_data(path, use_cache=True):
+    """
+    Return the raw parsed contents of the YAML config.
+
+    When use_cache is set, a JSON copy is kept at <path>.cache.json and is
+    used instead of the YAML while the YAML's mtime and size exactly match
+    the ones recorded in the cache. An exact match (rather than "cache is
+    newer") also catches YAML files whose mtime moved backwards, e.g. after
+    cp -p or restoring from an archive.
+    Returns None when the YAML cannot be parsed because PyYAML is missing.
+    """
+    st = os.stat(path)
+    source = [st.st_mtime_ns, st.st_size]
+    cache_path = _config_cache_path(path)
+
+    if use_cache:
+        try:
+            with open(cache_path, "r", encoding="utf-8") as f:
+                cached = json.load(f)
+
+            if isinstance(cached, dict) and cached.get("source") == source:
+                return cached.get("data")
+
+        except FileNotFoundError:
+            pass
+
+        except Exception as e:
+            logger.warning("Ignoring unreadable config cache %s: %s", cache_path, e)
+
+    if yaml is None:
+        logger.warning("PyYAML not installed; using defaults. Install with: pip install pyyaml")
+        return None
+
+    with open(path, "r", encoding="utf-8") as f:
+        data = yaml.load(f, Loader=YAML_LOADER)
+
+    if use_cache:
+        _write_config_cache(cache_path, source, data)
+
+    return data
+
+
+def load_config(path="config.yaml", use_cache=True):
     cfg = {
         "COM": "/dev/ttyUSB0",
         "BAUD": 500000,
         "buttons": [],
         "precision": 3,
 
+        # GUI redraws per second; faster serial frames are coalesced
+        "refresh_hz": 30,
+
         "log_dir": "logs",
         "log_format": "csv",
         "log_prefix": "serial_log",
@@ -661,12 +766,7 @@ def load_config(path="config.yaml"):
         return cfg
 
     try:
-        if yaml is None:
-            logger.warning("PyYAML not installed; using defaults. Install with: pip install pyyaml")
-            return cfg
-
-        with open(path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f) or {}
+        data = _read_config_data(path, use_cache=use_cache) or {}
 
         if not isinstance(data, dict):
             return cfg
@@ -737,6 +837,18 @@ def load_config(path="config.yaml"):
             except Exception:
                 logger.warning("Invalid precision in YAML; using default 3")
 
+        if "refresh_hz" in data:
+            try:
+                hz = float(data["refresh_hz"])
+
+                if not (math.isfinite(hz) and hz > 0):
+                    raise ValueError
+
+                cfg["refresh_hz"] = hz
+
+            except Exception:
+                logger.warning("Invalid refresh_hz in YAML; using default 30")
+
         if "heatmaps" in data and isinstance(data["heatmaps"], list):
             hm = []
 
@@ -794,18 +906,41 @@ def load_config(path="config.yaml"):
 # ---------------------------------------------------------------------
 
 class SerialWorker(QObject):
-    data_received = pyqtSignal(dict)
+    # parsed JSON, digest of the raw line, frame_processor result (or None).
+    # The payload is declared as object so the parsed value is passed by
+    # reference instead of being converted to and from a QVariantMap.
+    data_received = pyqtSignal(object, bytes, object)
 
-    def __init__(self, port="/dev/ttyUSB0", baudrate=500000, data_logger=None):
+    def __init__(
+        self,
+        port="/dev/ttyUSB0",
+        baudrate=500000,
+        data_logger=None,
+        frame_processor=None,
+        emit_interval=0.0
+    ):
         super().__init__()
 
         self.port = port
         self.baudrate = baudrate
         self.data_logger = data_logger
 
+        # Optional callable run in this worker thread on each frame that is
+        # emitted, so render preparation stays off the GUI thread.
+        self.frame_processor = frame_processor
+
+        # Minimum seconds between emits. Every frame is still logged, but
+        # only the latest one in each interval is prepared and emitted, and
+        # frames identical to the previous one are never emitted.
+        self.emit_interval = emit_interval
+        self._pending_frame = None
+        self._last_digest = None
+        self._last_emit = 0.0
+
         self._running = True
         self.serial_port = None
         self.reconnect_delay = 1.0
+        self.max_buffer_bytes = 1024 * 1024
         self._lock = threading.RLock()
 
     def _close_port(self):
@@ -826,7 +961,7 @@ class SerialWorker(QObject):
             self.serial_port = serial.Serial(
                 self.port,
                 self.baudrate,
-                timeout=0.2,
+                timeout=0.01,
                 write_timeout=0.5
             )
 
@@ -841,14 +976,138 @@ class SerialWorker(QObject):
 
             time.sleep(0.1)
 
+    @staticmethod
+    def _parse_line(line):
+        try:
+            return json_loads(line)
+        except ValueError:
+            if json_loads is json.loads:
+                raise
+
+            # orjson/ujson reject some input the stdlib parser accepts,
+            # such as NaN/Infinity.
+            return json.loads(line)
+
+    @staticmethod
+    def _split_documents(text):
+        """
+        Decode several JSON documents written back to back on one line,
+        e.g. '{"a": 1}{"b": 2}'. Returns (raw_bytes, value) pairs, or an
+        empty list unless the whole line decodes into objects/arrays, so
+        plain-text lines such as "0 errors" are not mistaken for frames.
+        """
+        frames = []
+        pos = 0
+        end = len(text)
+
+        while pos < end:
+            try:
+                value, next_pos = _json_decoder.raw_decode(text, pos)
+            except ValueError:
+                return []
+
+            if not isinstance(value, (dict, list)):
+                return []
+
+            frames.append((text[pos:next_pos].encode("utf-8"), value))
+            pos = next_pos
+
+            while pos < end and text[pos].isspace():
+                pos += 1
+
+        return frames
+
+    def _decode_line(self, line):
+        """
+        Return (raw_bytes, value) pairs for the JSON documents on a line.
+        """
+        try:
+            return [(line, self._parse_line(line))]
+        except ValueError:
+            pass
+
+        # Lines are parsed straight from bytes; the lenient decode that
+        # drops stray non-UTF-8 bytes is only paid when parsing fails.
+        text = line.decode("utf-8", errors="ignore")
+        cleaned = text.encode("utf-8")
+
+        if cleaned != line:
+            try:
+                return [(cleaned, self._parse_line(cleaned))]
+            except ValueError:
+                pass
+
+        return self._split_documents(text)
+
+    def _handle_line(self, line):
+        # Lines arrive as bytearray slices; ujson only accepts str/bytes.
+        line = bytes(line.strip())
+
+        if not line:
+            return
+
+        frames = [
+            (raw, value)
+            for raw, value in self._decode_line(line)
+            if isinstance(value, (dict, list))
+        ]
+
+        if not frames:
+            logger.debug("Ignoring non-JSON serial line: %r", line)
+            return
+
+        for raw, json_data in frames:
+            self._publish(raw, json_data)
+
+    def _publish(self, raw, json_data):
+        if self.data_logger:
+            self.data_logger.log_received(self.port, json_data)
+
+        digest = hashlib.blake2b(raw, digest_size=16).digest()
+
+        if digest == self._last_digest:
+            return
+
+        self._last_digest = digest
+        self._pending_frame = (json_data, digest)
+        self._emit_pending()
+
+    def _emit_pending(self):
+        if self._pending_frame is None:
+            return
+
+        now = time.monotonic()
+
+        if now - self._last_emit < self.emit_interval:
+            return
+
+        json_data, digest = self._pending_frame
+        self._pending_frame = None
+        self._last_emit = now
+
+        prepared = None
+
+        if self.frame_processor:
+            try:
+                prepared = self.frame_processor(json_data)
+            except Exception as e:
+                logger.warning("Could not prepare frame for display: %s", e)
+                return
+
+        self.data_received.emit(json_data, digest, prepared)
+
     def start(self):
-        buffer = ""
+        buffer = bytearray()
 
         while self._running:
+            # Sends a frame held back by emit_interval once it is due; the
+            # short read timeout keeps this ticking on an idle port.
+            self._emit_pending()
+
             if self.serial_port is None or not self.serial_port.is_open:
                 try:
                     self._open_port()
-                    buffer = ""
+                    buffer = bytearray()
 
                 except serial.SerialException as e:
                     logger.error("Could not open serial port %s: %s", self.port, e)
@@ -873,28 +1132,27 @@ class SerialWorker(QObject):
                     if self.serial_port is None or not self.serial_port.is_open:
                         continue
 
-                    line = self.serial_port.readline().decode(
-                        "utf-8",
-                        errors="ignore"
-                    )
+                    sp = self.serial_port
+                    chunk = sp.read(max(1, sp.in_waiting))
 
-                if not line:
+                if not chunk:
                     continue
 
-                buffer = line.strip()
+                buffer.extend(chunk)
 
-                try:
-                    json_data = json.loads(buffer)
+                if b"\n" in chunk:
+                    lines = buffer.split(b"\n")
+                    buffer = lines.pop()
 
-                    if self.data_logger:
-                        self.data_logger.log_received(self.port, json_data)
+                    for line in lines:
+                        self._handle_line(line)
 
-                    self.data_received.emit(json_data)
-                    buffer = ""
-
-                except json.JSONDecodeError:
-                    logger.debug("Ignoring non-JSON serial line: %s", buffer)
-                    continue
+                if len(buffer) > self.max_buffer_bytes:
+                    logger.warning(
+                        "Dropping %d buffered serial bytes without a newline",
+                        len(buffer)
+                    )
+                    buffer = bytearray()
 
             except serial.SerialException as e:
                 logger.error("Serial port read error: %s", e)
@@ -970,11 +1228,253 @@ class SerialWorker(QObject):
                 return False
 
 
+# ---------------------------------------------------------------------
+# Heatmap table model
+# ---------------------------------------------------------------------
+
+def _format_cell(val, precision):
+    try:
+        num = float(val)
+        s = f"{num:.{precision}f}"
+
+        if precision > 0:
+            s = s.rstrip("0").rstrip(".")
+        else:
+            s = s.split(".")[0]
+
+        return s
+
+    except Exception:
+        return str(val)
+
+
+# Telemetry values repeat a lot between frames, so most cells hit the cache.
+_format_cached = lru_cache(maxsize=8192)(_format_cell)
+
+
+def _gradient(start, end, steps):
+    return [
+        QColor(*(int(a + (b - a) * i / (steps - 1)) for a, b in zip(start, end)))
+        for i in range(steps)
+    ]
+
+
+class HeatmapTableModel(QAbstractTableModel):
+    """
+    Read-only model for one 2D JSON array.
+
+    Cell text and heatmap colors are computed in data() on demand, so Qt
+    only does the work for cells it actually paints instead of allocating
+    one item object per cell.
+    """
+
+    red_cap_factor = 5.0
+
+    # Heatmap gradients, built once: close to average fades to stronger
+    # green, above max deviation fades to stronger red. Cells index into
+    # green_palette + red_palette instead of constructing their own QColor.
+    palette_steps = 256
+    green_palette = _gradient((234, 251, 234), (184, 240, 184), palette_steps)
+    red_palette = _gradient((255, 234, 234), (255, 140, 140), palette_steps)
+    palette = green_palette + red_palette
+
+    def __init__(
+        self,
+        table_data,
+        precision=3,
+        max_dev=None,
+        parent=None,
+        prepared=None
+    ):
+        super().__init__(parent)
+
+        self.precision = precision
+        self._load(table_data, max_dev, prepared)
+
+    def set_table(self, table_data, max_dev=None, prepared=None):
+        """
+        Swap in new data for the same table.
+
+        prepared is the result of prepare() for this data, if it was already
+        computed elsewhere.
+
+        Returns True when the shape is unchanged, in which case views only
+        get a dataChanged and keep their layout; otherwise the model is reset.
+        """
+        if prepared is None:
+            prepared = self.prepare(table_data, max_dev)
+
+        rows, cols, _ = prepared
+        same_shape = rows == self.rowCount() and cols == self.columnCount()
+
+        if not same_shape:
+            self.beginResetModel()
+
+        self._load(table_data, max_dev, prepared)
+
+        if not same_shape:
+            self.endResetModel()
+        elif rows and cols:
+            self.dataChanged.emit(
+                self.index(0, 0),
+                self.index(rows - 1, cols - 1),
+                [Qt.DisplayRole, Qt.BackgroundRole]
+            )
+
+        return same_shape
+
+    def _load(self, table_data, max_dev, prepared=None):
+        if prepared is None:
+            prepared = self.prepare(table_data, max_dev)
+
+        self.table_data = table_data
+        self._rows, self._cols, self._color_index = prepared
+
+    @classmethod
+    def prepare(cls, table_data, max_dev):
+        """
+        Compute everything data() needs for a table.
+
+        Returns (rows, cols, color_index). Touches no Qt objects, so it can
+        run in the serial worker thread.
+        """
+        values = cls._to_float_array(table_data)
+        numeric = ~np.isnan(values)
+
+        avg = float(values[numeric].mean()) if numeric.any() else 0.0
+        color_index = cls._heatmap_color_index(values, avg, max_dev)
+        rows, cols = values.shape
+
+        return rows, cols, color_index
+
+    @staticmethod
+    def _to_float_array(table_data):
+        """
+        Convert the table to a float64 array; non-numeric cells become NaN.
+        """
+        try:
+            values = np.asarray(table_data, dtype=np.float64)
+
+            if values.ndim == 2:
+                return values
+
+        except (TypeError, ValueError, OverflowError):
+            pass
+
+        rows, cols = len(table_data), len(table_data[0])
+        values = np.full((rows, cols), np.nan)
+
+        for i, r in enumerate(table_data):
+            for j, v in enumerate(r):
+                try:
+                    values[i, j] = float(v)
+                except Exception:
+                    pass
+
+        return values
+
+    @classmethod
+    def _heatmap_color_index(cls, values, avg, max_dev):
+        """
+        Compute the palette index of every cell at once.
+
+        Returns an int array with -1 for cells without a background, or None
+        when the table is not a heatmap.
+        """
+        if max_dev is None or avg == 0:
+            return None
+
+        diff = values - avg
+        diff_abs = np.abs(diff) / abs(avg)
+
+        green = diff <= max_dev
+        red = diff > max_dev
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t_green = 1.0 - diff_abs / max_dev
+
+        denom = max(max_dev * cls.red_cap_factor, 1e-12)
+        t_red = (diff_abs - max_dev) / denom
+
+        t = np.clip(np.nan_to_num(np.where(green, t_green, t_red)), 0.0, 1.0)
+
+        steps = cls.palette_steps
+        index = (t * (steps - 1)).astype(np.int64)
+        index[red] += steps
+
+        colored = red | (green & (max_dev > 0))
+        index[~colored] = -1
+
+        return index
+
+    # ------------------------------------------------------------
+    # Qt model interface
+    # ------------------------------------------------------------
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+
+        return self._rows
+
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+
+        return self._cols
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        if role == Qt.DisplayRole:
+            return self._format_for_display(self.table_data[index.row()][index.column()])
+
+        if role == Qt.BackgroundRole:
+            if self._color_index is None:
+                return None
+
+            i = self._color_index[index.row(), index.column()]
+            return self.palette[i] if i >= 0 else None
+
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole:
+            return str(section + 1)
+
+        return None
+
+    # ------------------------------------------------------------
+    # Formatting
+    # ------------------------------------------------------------
+
+    def _format_for_display(self, val):
+        try:
+            return _format_cached(val, self.precision)
+        except TypeError:
+            # unhashable cell, e.g. a nested list
+            return _format_cell(val, self.precision)
+
+
 # ---------------------------------------------------------------------
 # Table viewer
 # ---------------------------------------------------------------------
 
+def clear_layout(layout):
+    # Take items from the end: takeAt(0) shifts every remaining item.
+    for i in range(layout.count() - 1, -1, -1):
+        w = layout.takeAt(i).widget()
+
+        if w:
+            w.hide()
+            w.deleteLater()
+
+
 class TableViewer(QWidget):
+    # Taller tables scroll internally instead of growing the panel.
+    max_visible_rows = 40
+
     def __init__(self, precision=3, heatmap_rules=None, default_max_dev=0.05):
         super().__init__()
 
@@ -982,6 +1482,13 @@ class TableViewer(QWidget):
         self.heatmap_rules = dict(heatmap_rules) if heatmap_rules else None
         self.default_max_dev = float(default_max_dev) if default_max_dev is not None else 0.05
 
+        # key -> max deviation, or None for tables without a heatmap
+        if self.heatmap_rules is None:
+            default_max_dev = self.default_max_dev
+            self._max_dev_for = lambda key: default_max_dev
+        else:
+            self._max_dev_for = self.heatmap_rules.get
+
         layout = QVBoxLayout(self)
         layout.setContentsMargins(5, 5, 5, 5)
         layout.setSpacing(5)
@@ -1000,45 +1507,66 @@ class TableViewer(QWidget):
         self.scroll = scroll
         self.content = content
         self.content_layout = content_layout
-        self.last_rendered = None
-
-    def display_tables(self, data):
-        if data == self.last_rendered:
-            return
+        # (key, table view) for every table currently shown, in render order
+        self._tables = []
 
-        self.clear_layout(self.content_layout)
-        self.render_data(data)
-        self.last_rendered = data
+    def prepare_tables(self, tables):
+        """
+        Attach HeatmapTableModel.prepare() results to (key, 2D array) pairs.
 
-    def render_data(self, data):
-        if isinstance(data, dict):
-            for key, value in data.items():
-                if isinstance(value, list) and self.is_2d_array(value):
-                    self.add_label(key + ":", bold=True)
+        Only reads settings fixed at construction, so the serial worker can
+        call it for each frame.
+        """
+        return [
+            (key, value, HeatmapTableModel.prepare(value, self._max_dev_for(key)))
+            for key, value in tables
+        ]
 
-                    max_dev = None
+    def display_tables(self, tables):
+        """
+        Show the (key, 2D array, prepared) tables of one frame.
+        """
+        # Repaint once after all tables are updated, not once per table.
+        self.content.setUpdatesEnabled(False)
 
-                    if self.heatmap_rules is None:
-                        max_dev = self.default_max_dev
-                    elif key in self.heatmap_rules:
-                        max_dev = self.heatmap_rules[key]
+        try:
+            # Same tables as last frame: update the existing views in place
+            # and only rebuild the widgets when the set of tables changes.
+            if [key for key, _, _ in tables] == [key for key, _ in self._tables]:
+                for (key, value, prepared), (_, table) in zip(tables, self._tables):
+                    self.update_table(
+                        table,
+                        value,
+                        max_dev=self._max_dev_for(key),
+                        prepared=prepared
+                    )
+            else:
+                self.render_data(tables)
 
-                    self.add_table(value, max_dev=max_dev)
+        finally:
+            self.content.setUpdatesEnabled(True)
 
-                elif isinstance(value, (dict, list)):
-                    self.render_data(value)
+    def render_data(self, tables):
+        clear_layout(self.content_layout)
+        self._tables = []
 
-        elif isinstance(data, list):
-            for item in data:
-                self.render_data(item)
+        for key, value, prepared in tables:
+            self.add_label(key + ":", bold=True)
+            table = self.add_table(value, max_dev=self._max_dev_for(key), prepared=prepared)
+            self._tables.append((key, table))
 
     def is_2d_array(self, arr):
-        return (
-            isinstance(arr, list)
-            and arr
-            and all(isinstance(r, list) for r in arr)
-            and all(len(r) == len(arr[0]) for r in arr)
-        )
+        # Parsed JSON only contains plain lists, so exact type checks suffice.
+        if type(arr) is not list or not arr or type(arr[0]) is not list:
+            return False
+
+        width = len(arr[0])
+
+        for r in arr:
+            if type(r) is not list or len(r) != width:
+                return False
+
+        return True
 
     def add_label(self, text, bold=False):
         label = QLabel(text)
@@ -1050,128 +1578,54 @@ class TableViewer(QWidget):
 
         self.content_layout.addWidget(label)
 
-    def _format_for_display(self, val):
-        try:
-            num = float(val)
-            s = f"{num:.{self.precision}f}"
-
-            if self.precision > 0:
-                s = s.rstrip("0").rstrip(".")
-            else:
-                s = s.split(".")[0]
-
-            return s
-
-        except Exception:
-            return str(val)
-
-    @staticmethod
-    def _lerp(a, b, t):
-        return int(a + (b - a) * max(0.0, min(1.0, t)))
-
-    @staticmethod
-    def _qcolor_from_rgb(r, g, b):
-        return QColor(int(r), int(g), int(b))
-
-    def _green_color(self, t):
-        r = self._lerp(234, 184, t)
-        g = self._lerp(251, 240, t)
-        b = self._lerp(234, 184, t)
-        return self._qcolor_from_rgb(r, g, b)
-
-    def _red_color(self, t):
-        r = self._lerp(255, 255, t)
-        g = self._lerp(234, 140, t)
-        b = self._lerp(234, 140, t)
-        return self._qcolor_from_rgb(r, g, b)
-
-    def _violet_color(self, t):
-        r = self._lerp(255, 255, t)
-        g = self._lerp(234, 140, t)
-        b = self._lerp(234, 240, t)
-        return self._qcolor_from_rgb(r, g, b)
-
-    def add_table(self, table_data, max_dev=None):
-        rows, cols = len(table_data), len(table_data[0])
-
-        nums = []
-
-        for r in table_data:
-            for v in r:
-                try:
-                    nums.append(float(v))
-                except Exception:
-                    pass
-
-        avg = sum(nums) / len(nums) if nums else 0.0
+    def add_table(self, table_data, max_dev=None, prepared=None):
+        table = QTableView()
+        model = HeatmapTableModel(
+            table_data,
+            precision=self.precision,
+            max_dev=max_dev,
+            parent=table,
+            prepared=prepared
+        )
 
-        table = QTableWidget(rows, cols)
-        table.setVerticalHeaderLabels([str(i + 1) for i in range(rows)])
+        table.setModel(model)
         table.verticalHeader().setVisible(True)
         table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
-        table.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         table.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         table.setSizeAdjustPolicy(QAbstractScrollArea.AdjustToContents)
+        table.setStyleSheet("QTableView { border: 1px solid #ccc; }")
 
-        red_cap_factor = 5.0
-
-        for i in range(rows):
-            for j in range(cols):
-                raw_val = table_data[i][j]
-                display_text = self._format_for_display(raw_val)
+        self.fit_table(table)
+        self.content_layout.addWidget(table)
 
-                item = QTableWidgetItem(display_text)
+        return table
 
-                if max_dev is not None and avg != 0:
-                    try:
-                        num = float(raw_val)
-
-                        diff_abs = abs(num - avg) / abs(avg)
-                        diff = num - avg
-
-                        if diff <= max_dev:
-                            t = (diff_abs / max_dev) * -1 + 1
-                            color = self._green_color(t)
-                            item.setBackground(color)
-
-                        elif diff > max_dev:
-                            over = diff_abs - max_dev
-                            denom = max(max_dev * red_cap_factor, 1e-12)
-                            t = max(0.0, min(1.0, over / denom))
-                            color = self._red_color(t)
-                            item.setBackground(color)
-
-                        else:
-                            over = diff_abs - max_dev
-                            denom = max(max_dev * red_cap_factor, 1e-12)
-                            t = max(0.0, min(1.0, over / denom))
-                            color = self._violet_color(t)
-                            item.setBackground(color)
+    def update_table(self, table, table_data, max_dev=None, prepared=None):
+        if not table.model().set_table(table_data, max_dev=max_dev, prepared=prepared):
+            self.fit_table(table)
 
-                    except Exception:
-                        pass
+    def fit_table(self, table):
+        table.resizeColumnsToContents()
 
-                table.setItem(i, j, item)
+        rows = table.model().rowCount()
+        header = table.verticalHeader()
 
-        table.resizeColumnsToContents()
+        # Tall tables get a capped height and their own scrollbar, so the
+        # view only asks the model for the rows that are actually on screen.
+        if rows > self.max_visible_rows:
+            body = header.defaultSectionSize() * self.max_visible_rows
+            table.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
+        else:
+            body = header.length()
+            table.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
 
         height = (
-            sum(table.rowHeight(i) for i in range(rows))
+            body
             + table.horizontalHeader().height()
+            + 2 * table.frameWidth()
         )
 
         table.setFixedHeight(height)
-        table.setStyleSheet("QTableWidget { border: 1px solid #ccc; }")
-
-        self.content_layout.addWidget(table)
-
-    def clear_layout(self, layout):
-        while layout.count():
-            item = layout.takeAt(0)
-            w = item.widget()
-
-            if w:
-                w.setParent(None)
 
 
 # ---------------------------------------------------------------------
@@ -1188,7 +1642,8 @@ class App(QWidget):
         heatmaps=None,
         legacy_tables=None,
         legacy_max_dev=0.05,
-        data_logger=None
+        data_logger=None,
+        refresh_hz=30
     ):
         super().__init__()
 
@@ -1236,6 +1691,8 @@ class App(QWidget):
         self.non_table_layout.setSpacing(5)
 
         self.non_table_display.setWidget(self.non_table_content)
+        self._last_non_table_rows = None
+        self._non_table_labels = []
 
         main_layout.addWidget(self.non_table_display)
 
@@ -1286,10 +1743,23 @@ class App(QWidget):
         main_layout.setStretchFactor(self.table_viewer, 1)
         main_layout.setStretchFactor(self.non_table_display, 2)
 
+        # Frames arriving faster than the screen can show them are coalesced;
+        # only the latest one is rendered, at most refresh_hz times per second.
+        self._pending_data = None
+        self._pending_digest = None
+        self._pending_prepared = None
+        self._last_digest = None
+        self._render_timer = QTimer(self)
+        self._render_timer.setSingleShot(True)
+        self._render_timer.setInterval(max(1, int(1000 / refresh_hz)))
+        self._render_timer.timeout.connect(self._flush_pending)
+
         self.worker = SerialWorker(
             port=port,
             baudrate=baudrate,
-            data_logger=self.data_logger
+            data_logger=self.data_logger,
+            frame_processor=self.prepare_frame,
+            emit_interval=1.0 / refresh_hz
         )
 
         self.thread = QThread()
@@ -1302,12 +1772,7 @@ class App(QWidget):
         self.build_quick_buttons(buttons or [])
 
     def build_quick_buttons(self, buttons):
-        while self.quick_buttons_layout.count():
-            item = self.quick_buttons_layout.takeAt(0)
-            w = item.widget()
-
-            if w:
-                w.setParent(None)
+        clear_layout(self.quick_buttons_layout)
 
         if not buttons:
             note = QLabel("No quick commands configured.")
@@ -1356,49 +1821,137 @@ class App(QWidget):
             self.cmd_history.addItem(cmd)
             self.cmd_input.clear()
 
-    def update_view(self, data):
-        self.table_viewer.display_tables(data)
-        self.render_non_table(data)
+    def update_view(self, data, digest=None, prepared=None):
+        self._pending_data = data
+        self._pending_digest = digest
+        self._pending_prepared = prepared
 
-    def render_non_table(self, data):
-        while self.non_table_layout.count():
-            w = self.non_table_layout.takeAt(0).widget()
+        if not self._render_timer.isActive():
+            self._render_timer.start()
 
-            if w:
-                w.setParent(None)
+    def _flush_pending(self):
+        data = self._pending_data
+        digest = self._pending_digest
+        prepared = self._pending_prepared
+        self._pending_data = None
+        self._pending_digest = None
+        self._pending_prepared = None
 
-        def add_wrapping_label(text, bold=False, indent=0):
-            lbl = QLabel(text)
+        if data is None:
+            return
 
-            if bold:
-                lbl.setStyleSheet("font-weight:bold;")
+        # A digest of the raw line is much cheaper to compare than the nested
+        # payload; frames without one are always rendered.
+        if digest is not None and digest == self._last_digest:
+            return
 
-            if indent:
-                lbl.setIndent(indent)
+        self._last_digest = digest
 
+        # Only frames from a worker without a frame processor arrive
+        # unprepared; a bad frame is skipped instead of raising in the slot.
+        if prepared is None:
+            try:
+                prepared = self.prepare_frame(data)
+            except Exception as e:
+                logger.warning("Could not prepare frame for display: %s", e)
+                return
+
+        tables, rows = prepared
+
+        self.table_viewer.display_tables(tables)
+        self.render_non_table(rows)
+
+    def prepare_frame(self, data):
+        """
+        Turn a payload into (tables, rows) ready for display.
+
+        Runs in the serial worker thread for incoming frames; it only reads
+        settings fixed at construction and creates no Qt objects.
+        """
+        tables, rows = self.split_payload(data)
+        return self.table_viewer.prepare_tables(tables), rows
+
+    def split_payload(self, data):
+        """
+        Walk the payload once and split it between the two panels.
+
+        Returns (tables, rows): (key, 2D array) pairs for the table viewer,
+        in depth-first order, and (text, bold, indent) labels for the
+        non-table panel. Only the top level is shown as text; deeper levels
+        are searched for tables only.
+        """
+        is_2d_array = self.table_viewer.is_2d_array
+
+        tables = []
+        rows = []
+
+        # (key, value, show_text); key is None for the root and list items
+        stack = [(None, data, True)]
+
+        while stack:
+            key, value, show_text = stack.pop()
+
+            if key is not None:
+                if isinstance(value, list) and is_2d_array(value):
+                    tables.append((key, value))
+                    continue
+
+                if show_text:
+                    rows.append((f"{key}:", True, 0))
+                    rows.append((str(value), False, 10))
+
+                show_text = False
+
+            elif not isinstance(value, (dict, list)):
+                if show_text:
+                    rows.append((str(value), False, 0))
+
+                continue
+
+            if isinstance(value, dict):
+                stack.extend((k, v, show_text) for k, v in reversed(value.items()))
+
+            elif isinstance(value, list):
+                stack.extend((None, item, show_text) for item in reversed(value))
+
+        return tables, rows
+
+    def render_non_table(self, rows):
+        # Table-only updates leave the text panel as it is.
+        if rows == self._last_non_table_rows:
+            return
+
+        self._last_non_table_rows = rows
+
+        self.non_table_content.setUpdatesEnabled(False)
+
+        try:
+            self._fill_non_table_labels(rows)
+        finally:
+            self.non_table_content.setUpdatesEnabled(True)
+
+    def _fill_non_table_labels(self, rows):
+        # Labels are pooled: existing ones are retargeted with setText and
+        # surplus ones hidden, new ones are only created when the pool is short.
+        labels = self._non_table_labels
+
+        while len(labels) < len(rows):
+            lbl = QLabel()
             lbl.setWordWrap(True)
             lbl.setTextInteractionFlags(Qt.TextSelectableByMouse)
             lbl.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Maximum)
 
             self.non_table_layout.addWidget(lbl)
+            labels.append(lbl)
 
-        def recurse(d):
-            if isinstance(d, dict):
-                for k, v in d.items():
-                    if isinstance(v, list) and self.table_viewer.is_2d_array(v):
-                        continue
-
-                    add_wrapping_label(f"{k}:", bold=True)
-                    add_wrapping_label(str(v), indent=10)
-
-            elif isinstance(d, list):
-                for item in d:
-                    recurse(item)
-
-            else:
-                add_wrapping_label(str(d))
+        for lbl, (text, bold, indent) in zip(labels, rows):
+            lbl.setText(text)
+            lbl.setStyleSheet("font-weight:bold;" if bold else "")
+            lbl.setIndent(indent if indent else -1)
+            lbl.setVisible(True)
 
-        recurse(data)
+        for lbl in labels[len(rows):]:
+            lbl.setVisible(False)
 
     def closeEvent(self, event):
         try:
@@ -1452,7 +2005,8 @@ if __name__ == "__main__":
         heatmaps=heatmaps,
         legacy_tables=legacy_tables,
         legacy_max_dev=legacy_max_dev,
-        data_logger=serial_logger
+        data_logger=serial_logger,
+        refresh_hz=cfg.get("refresh_hz", 30)
     )
 
     win.show()